@@ -1,61 +1,119 @@
-import ijson
 import json
 import os
 import logging
+import functools
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional, it is only needed to search a file without loading it
+    ijson = None
 
 # Setup logger for this module
 logger = logging.getLogger(__name__)
 
+# APIC status attribute value for each supported status type
+STATUS_VALUES = {
+    "create": "created,modified",
+    "delete": "deleted"
+}
+
+# Object types that never contain another object of the same type, so a search for
+# one of them does not need to look inside the objects of that type it finds
+NO_RECURSE_UNDER = frozenset({
+    "fvTenant", "fvAp", "fvAEPg", "fvBD", "fvCtx", "fvSubnet",
+    "vzBrCP", "vzSubj", "vzFilter", "l3extOut"
+})
 
-def build_nested_object(file_path):
+# Files larger than this are decoded from a stream by ijson, when it is installed, so that
+# the raw file contents never have to be held in memory next to the parsed tree
+STREAMING_THRESHOLD = 512 * 1024 * 1024
+
+
+def build_nested_object(file_path, streaming=None):
     """
-    Build a nested Python object from an APIC JSON file using streaming parser.
+    Build a nested Python object from an APIC JSON file.
+    
+    The whole document is decoded in a single call to orjson, or to the standard
+    library json module when orjson is not installed. Both build the nested
+    dicts and lists in C, which is much faster than assembling the tree from
+    streaming parser events in Python. Files can instead be decoded from the open
+    file by ijson, which is slower but does not need the raw contents in memory.
     
     Args:
-        file_path (str): Path to the APIC JSON file to parse.
+        file_path (str or file): Path to the APIC JSON file to parse, or a binary
+                                 file object to read it from (e.g., an upload).
+        streaming (bool, optional): True to always decode with ijson, False to never
+                                    do so. By default ijson is used, when installed,
+                                    for files given by a path that are larger than
+                                    STREAMING_THRESHOLD.
         
     Returns:
         dict: The parsed nested object representation of the JSON file.
     """
-    logger.info(f"Parsing file: {file_path}")
-    with open(file_path, 'rb') as file:
-        parser = ijson.parse(file)
-        stack = []
-        result = None
+    is_path = isinstance(file_path, (str, bytes, os.PathLike))
+    source_name = file_path if is_path else getattr(file_path, "name", "<stream>")
+    
+    logger.info("Parsing file: %s", source_name)
+    if streaming is None:
+        streaming = is_path and ijson is not None and os.path.getsize(file_path) > STREAMING_THRESHOLD
+    elif streaming and ijson is None:
+        raise ImportError("ijson is required to decode a file from a stream")
+    
+    file = open(file_path, 'rb') if is_path else file_path
+    try:
+        if streaming:
+            _check_ijson_backend()
+            logger.info("Decoding file from a stream: %s", source_name)
+            result = next(ijson.items(file, '', use_float=True))
+        else:
+            content = file.read()
+            result = orjson.loads(content) if orjson is not None else json.loads(content)
+    finally:
+        # Streams belong to the caller, only close the files opened here
+        if is_path:
+            file.close()
+    
+    logger.info("Successfully parsed file: %s", source_name)
+    return result
+
+
+def _get_name(obj_data):
+    """
+    Helper function to get the name attribute of an APIC object with a single
+    attributes lookup and no throwaway default dict.
+    
+    Args:
+        obj_data (dict): The object's content (e.g., the value of {'fvBD': {...}}).
         
-        for prefix, event, value in parser:
-            if event == 'start_map':  # Entering an object
-                new_dict = {}
-                if stack:
-                    parent = stack[-1]
-                    if isinstance(parent, dict):
-                        key = prefix.split('.')[-1] if '.' in prefix else prefix
-                        parent[key] = new_dict
-                    elif isinstance(parent, list):
-                        parent.append(new_dict)
-                stack.append(new_dict)
-                if result is None:
-                    result = new_dict
-            elif event == 'start_array':  # Entering an array
-                new_array = []
-                if stack:
-                    parent = stack[-1]
-                    if isinstance(parent, dict):
-                        key = prefix.split('.')[-1] if '.' in prefix else prefix
-                        parent[key] = new_array
-                stack.append(new_array)
-            elif event == 'end_map' or event == 'end_array':  # Leaving an object or array
-                stack.pop()
-            elif event in ('string', 'number', 'boolean', 'null'):  # Leaf value
-                if stack:
-                    parent = stack[-1]
-                    if isinstance(parent, dict):
-                        key = prefix.split('.')[-1]
-                        parent[key] = value
-                    elif isinstance(parent, list):
-                        parent.append(value)
-        logger.info(f"Successfully parsed file: {file_path}")
-        return result
+    Returns:
+        str: The name, or None if the object has no attributes or no name.
+    """
+    attributes = obj_data.get("attributes")
+    return attributes.get("name") if attributes is not None else None
+
+
+def _root_dicts(data):
+    """
+    Helper function to get the dicts an iterative DFS starts from. The stacks of the
+    search functions only hold dicts, so a root list (e.g., a bare imdata array) is
+    replaced by its dict items, and any other root has nothing to search.
+    
+    Args:
+        data (dict or list): The nested dictionary/list structure to search within.
+        
+    Returns:
+        list: The initial DFS stack.
+    """
+    if isinstance(data, dict):
+        return [data]
+    if isinstance(data, list):
+        return [item for item in data if isinstance(item, dict)]
+    return []
 
 
 def get_top_level_objects(data):
@@ -71,114 +129,308 @@ def get_top_level_objects(data):
     top_level = []
     try:
         for item in data["imdata"]:
-            if "fvTenant" in item:
-                children = item["fvTenant"].get("children", [])
+            tenant = item.get("fvTenant")
+            if tenant is not None:
+                children = tenant.get("children") or ()
                 for child in children:
+                    # Every child is listed, several objects of the same type are expected
                     for key, value in child.items():
-                        if key not in top_level:
-                            top_level.append({
-                                key: value.get("attributes", {}).get("name", None),
-                                "children": [None if "children" not in value else value["children"]]
-                            })
+                        top_level.append({
+                            key: _get_name(value),
+                            "children": [value.get("children")]
+                        })
     except KeyError:
         return []
     return top_level
 
 
-def find_all_objects_by_name_iterative(data, object_type, names_list):
+def build_index(data):
+    """
+    Build an index of all named objects, keyed by object type and name.
+    
+    Walks the data once using the same iterative DFS as the find functions, so that
+    repeated searches become dictionary lookups instead of full tree walks. Matches
+    are stored in the order the DFS visits them, so the first entry for a key is the
+    object find_object_by_name_iterative would return.
+    
+    Args:
+        data (dict or list): The nested dictionary/list structure to index.
+        
+    Returns:
+        dict: A dictionary mapping (object_type, name) tuples to lists of the
+              matching objects [{object_type: value}, ...].
+    """
+    index = {}
+    stack = _root_dicts(data)
+    push = stack.append
+    pop = stack.pop
+    _type = type
+    _dict = dict
+    _list = list
+    
+    while stack:
+        current_obj = pop()
+        
+        for key, value in current_obj.items():
+            # Attribute dicts only hold scalar values, there is nothing to find inside them
+            if key == "attributes":
+                continue
+            
+            value_type = _type(value)
+            if value_type is _dict:
+                attributes = value.get("attributes")
+                if _type(attributes) is _dict:
+                    object_name = attributes.get("name")
+                    if object_name is not None:
+                        index.setdefault((key, object_name), []).append({key: value})
+                push(value)
+            
+            elif value_type is _list:
+                for item in value:
+                    if _type(item) is _dict:
+                        push(item)
+    
+    logger.info("Indexed %s named object(s).", len(index))
+    return index
+
+
+def find_objects_by_types_and_names(data, queries):
+    """
+    Find ALL objects matching any of several object types, each with its own
+    list of names, in a single iterative DFS pass over the data.
+
+    Args:
+        data (dict or list): The nested dictionary/list structure to search within.
+        queries (dict): A dictionary mapping each object type to the list of 'name'
+                        attribute values to match for that type
+                        (e.g., {'fvBD': ['BD_484', 'BD_721'], 'fvAp': ['WebApp']}).
+
+    Returns:
+        dict: A dictionary mapping each queried object type to the list of matching
+              objects found [{key: value}, ...]. Types without matches map to an
+              empty list.
+    """
+    # Make each names list a set for potentially faster 'in' checks, especially with many names
+    names_by_type = {object_type: set(names) for object_type, names in queries.items()}
+    found_objects = {object_type: [] for object_type in names_by_type}
+    # With a single type, objects of that type can't hold further matches if the type
+    # never nests in itself. Other types may nest in each other, so no pruning then.
+    prune_types = NO_RECURSE_UNDER.intersection(names_by_type) if len(names_by_type) == 1 else frozenset()
+    # Stack only ever holds dicts: list items are pushed directly when their list is
+    # reached, so popped entries need no type dispatch. APIC JSON never nests lists
+    # directly inside lists.
+    stack = _root_dicts(data)
+    # Bind the methods and builtins used in the loop to locals, which are cheaper to look up
+    push = stack.append
+    pop = stack.pop
+    _type = type
+    _dict = dict
+    _list = list
+    
+    logger.info("Searching for objects matching: %s", queries)
+
+    while stack:
+        current_obj = pop()
+
+        for key, value in current_obj.items():
+            # Attribute dicts only hold scalar values, there is nothing to find inside them
+            if key == "attributes":
+                continue
+
+            # Parsed JSON only contains exact dicts and lists, so an identity check on the
+            # type is enough and cheaper than isinstance()
+            value_type = _type(value)
+            if value_type is _dict:
+                if key in names_by_type:
+                    # Check if name is in the set of requested names for this type, with a
+                    # single attributes lookup and no throwaway default dict
+                    attributes = value.get("attributes")
+                    if attributes is not None:
+                        object_actual_name = attributes.get("name")
+                        if object_actual_name is not None and object_actual_name in names_by_type[key]:
+                            logger.debug("Found a match: '%s'", object_actual_name)
+                            found_objects[key].append({key: value})
+                            # Continue searching for other matches
+
+                # Keep exploring deeper in the hierarchy
+                if key not in prune_types:
+                    push(value)
+            elif value_type is _list:
+                for item in value:
+                    if _type(item) is _dict:
+                        push(item)
+
+    logger.info("Found %s matching object(s).", sum(len(objects) for objects in found_objects.values()))
+    return found_objects
+
+
+def find_all_objects_by_name_iterative(data, object_type, names_list, index=None):
     """
     Find ALL objects matching the type (key) and ANY of the names
     provided in the names_list (in attributes). Uses an iterative DFS approach.
 
     Args:
-        data (dict): The nested dictionary/list structure to search within.
+        data (dict or list): The nested dictionary/list structure to search within.
         object_type (str): The dictionary key identifying the object type (e.g., 'fvBD').
         names_list (list): A list of strings, where each string is a potential 'name'
                            attribute value to match (e.g., ['BD_484', 'BD791']).
+        index (dict, optional): An index built by build_index(data). When given, the
+                                matches are looked up instead of walking the data, and
+                                are grouped by name in the order of names_list.
 
     Returns:
         list: A list containing all matching objects found [{key: value}, ...].
               Returns an empty list ([]) if no matches are found.
     """
-    found_objects = []
-    stack = [(data, None)]
-
-    # Make the names_list a set for potentially faster 'in' checks, especially with many names
-    names_set = set(names_list)
+    if index is not None:
+        found_objects = []
+        for name in dict.fromkeys(names_list):
+            found_objects.extend(index.get((object_type, name), []))
+        logger.info("Found %s matching object(s) in the index.", len(found_objects))
+        return found_objects
     
-    logger.info(f"Searching for objects of type '{object_type}' with names: {', '.join(names_list)}")
-
-    while stack:
-        current_obj, _ = stack.pop()
-
-        if isinstance(current_obj, dict):
-            for key, value in current_obj.items():
-                if key == object_type and isinstance(value, dict) and "attributes" in value:
-                    # Check if name is in the list/set of requested names
-                    object_actual_name = value.get("attributes", {}).get("name")
-                    if object_actual_name is not None and object_actual_name in names_set:
-                        logger.debug(f"Found a match: '{object_actual_name}'")
-                        found_objects.append({key: value})
-                        # Continue searching for other matches
-
-                # Keep exploring deeper in the hierarchy
-                if isinstance(value, (dict, list)):
-                    stack.append((value, key))
+    return find_objects_by_types_and_names(data, {object_type: names_list})[object_type]
 
-        elif isinstance(current_obj, list):
-            for item in current_obj:
-                if isinstance(item, (dict, list)):
-                    stack.append((item, None))
 
-    logger.info(f"Found {len(found_objects)} matching object(s).")
-    return found_objects
-
-
-def find_object_by_name_iterative(data, object_type, name):
+def find_object_by_name_iterative(data, object_type, name, index=None):
     """
     Find a single object by its type and name using an iterative stack-based approach.
     
     Args:
-        data (dict): The nested dictionary/list structure to search within.
+        data (dict or list): The nested dictionary/list structure to search within.
         object_type (str): The dictionary key identifying the object type (e.g., 'fvBD').
         name (str): The name attribute value to match (e.g., 'BD_484').
+        index (dict, optional): An index built by build_index(data). When given, the
+                                object is looked up instead of walking the data.
         
     Returns:
         dict: The found object as it appears in the original JSON, or None if not found.
     """
-    # Stack holds tuples of (object, key) to explore
-    stack = [(data, None)]  # Start with the root object, no key yet
-    
-    logger.info(f"Searching for object of type '{object_type}' with name '{name}'")
+    if index is not None:
+        matches = index.get((object_type, name))
+        if matches:
+            return matches[0]
+        logger.info("No object of type '%s' with name '%s' found in the index.", object_type, name)
+        return None
+    
+    logger.info("Searching for object of type '%s' with name '%s'", object_type, name)
+    
+    # Stack holds the dicts to explore, starting with the root dict(s)
+    stack = _root_dicts(data)
+    push = stack.append
+    pop = stack.pop
+    _type = type
+    _dict = dict
+    _list = list
+    # Objects of a type that never nests in itself can't hold the target
+    prune = object_type in NO_RECURSE_UNDER
     
     while stack:
-        current_obj, parent_key = stack.pop()  # Get the next object to check
+        current_obj = pop()  # Get the next object to check
         
-        if isinstance(current_obj, dict):
-            for key, value in current_obj.items():
+        for key, value in current_obj.items():
+            # Attribute dicts only hold scalar values, there is nothing to find inside them
+            if key == "attributes":
+                continue
+            # Parsed JSON only contains exact dicts and lists, so checking the type by
+            # identity is enough and cheaper than isinstance()
+            value_type = _type(value)
+            if value_type is _dict:
                 # Check if this is the target object
-                if key == object_type and "attributes" in value:
-                    if value["attributes"].get("name") == name:
-                        logger.debug(f"Found a match: '{name}'")
+                if key == object_type:
+                    if _get_name(value) == name:
+                        logger.debug("Found a match: '%s'", name)
                         return {key: value}  # Found it, return the full object
-                # Add nested dictionaries to the stack
-                if isinstance(value, (dict, list)):
-                    stack.append((value, key))
+                    if prune:
+                        continue
+                # Add nested dictionaries to the stack, and the dicts of nested lists directly
+                push(value)
+            elif value_type is _list:
+                for item in value:
+                    if _type(item) is _dict:
+                        push(item)
+    
+    logger.info("No object of type '%s' with name '%s' found.", object_type, name)
+    return None  # Not found
+
+
+def _check_ijson_backend():
+    """
+    Warn when ijson runs on its pure-Python backend.
+    
+    ijson already picks the fastest backend available (yajl2_c, then yajl2_cffi, ...),
+    but falls back to pure Python when the C extension is missing, which is an order
+    of magnitude slower on large files.
+    """
+    if ijson.backend == "python":
+        logger.warning("ijson is using its pure-Python backend, install an ijson build with the "
+                       "yajl2_c backend (or libyajl) for much faster streaming")
+
+
+def iter_tenant_children(file_path):
+    """
+    Yield the top-level children of the tenants in an APIC JSON file, one at a time.
+    
+    Only the imdata.item.fvTenant.children.item prefix is built into Python objects,
+    everything else in the file is skipped by ijson, and each child can be dropped
+    by the caller before the next one is read.
+    
+    Args:
+        file_path (str): Path to the APIC JSON file.
         
-        elif isinstance(current_obj, list):
-            # Add each item in the list to the stack
-            for item in current_obj:
-                if isinstance(item, (dict, list)):
-                    stack.append((item, None))  # No key for list items
+    Yields:
+        dict: Each tenant child as it appears in the original JSON (e.g., {'fvBD': {...}}).
+    """
+    if ijson is None:
+        raise ImportError("ijson is required to read a file without loading it")
+    _check_ijson_backend()
     
-    logger.info(f"No object of type '{object_type}' with name '{name}' found.")
-    return None  # Not found
+    with open(file_path, 'rb') as file:
+        for child in ijson.items(file, 'imdata.item.fvTenant.children.item', use_float=True):
+            yield child
+
+
+def find_object_streaming(file_path, object_type, name):
+    """
+    Find a single object by its type and name directly in an APIC JSON file.
+    
+    Unlike build_nested_object followed by find_object_by_name_iterative, the
+    whole tree is never built: ijson yields the tenant's top-level children one at
+    a time, each is searched with find_object_by_name_iterative and then dropped,
+    so memory use is bounded by the largest top-level child.
+    
+    Only objects below the tenants are searched, tenants themselves are not. The
+    DFS of find_object_by_name_iterative searches the children last to first, so
+    the match of the last child holding one is kept, and a duplicated name gives
+    the same object as the in-memory search. The whole file is therefore read.
+    This assumes the layout of an APIC tenant export, where imdata only holds
+    fvTenant objects with their attributes and children.
+    
+    Args:
+        file_path (str): Path to the APIC JSON file to search.
+        object_type (str): The dictionary key identifying the object type (e.g., 'fvBD').
+        name (str): The name attribute value to match (e.g., 'BD_484').
+        
+    Returns:
+        dict: The found object as it appears in the original JSON, or None if not found.
+    """
+    logger.info("Streaming file '%s' for object of type '%s' with name '%s'", file_path, object_type, name)
+    result = None
+    for child in iter_tenant_children(file_path):
+        match = find_object_by_name_iterative(child, object_type, name)
+        if match is not None:
+            # A later child is searched earlier by the in-memory DFS
+            result = match
+    return result
 
 
 def get_tenant_info():
     """
     Get tenant information from the nested_object.json file.
     
+    The file is only parsed again when its modification time changes, so repeated
+    calls do not re-read it.
+    
     Returns:
         dict: The tenant attributes, or default values if the file can't be read.
     """
@@ -190,26 +442,88 @@ def get_tenant_info():
     
     try:
         nested_object_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'nested_object.json')
-        with open(nested_object_path, 'r') as f:
-            original_data = json.load(f)
-            if "imdata" in original_data and len(original_data["imdata"]) > 0:
-                if "fvTenant" in original_data["imdata"][0]:
-                    # Extract tenant attributes from original file
-                    tenant_info = original_data["imdata"][0]["fvTenant"]["attributes"]
-                    return tenant_info
+        mtime = os.stat(nested_object_path).st_mtime_ns
+        tenant_info = _read_tenant_info(nested_object_path, mtime)
+        if tenant_info is not None:
+            # Copy so that callers can't modify the cached attributes
+            return dict(tenant_info)
     except Exception as e:
-        logger.warning(f"Could not extract tenant information from nested_object.json: {e}")
+        logger.warning("Could not extract tenant information from nested_object.json: %s", e)
     
     return default_tenant_info
 
 
-def format_result_in_apic_standard(result):
+@functools.lru_cache(maxsize=1)
+def _read_tenant_info(file_path, mtime):
+    """
+    Read the attributes of the first tenant from a parsed-object JSON file.
+    
+    With ijson installed only the tenant attributes are decoded, otherwise the whole
+    file is parsed to reach them.
+    
+    Args:
+        file_path (str): Path to the JSON file.
+        mtime (int): Modification time of the file, only used as part of the cache key.
+        
+    Returns:
+        dict: The tenant attributes, or None if the file has no tenant.
+    """
+    if ijson is not None:
+        return get_tenant_info_from_file(file_path)
+    
+    with open(file_path, 'rb') as f:
+        content = f.read()
+    original_data = orjson.loads(content) if orjson is not None else json.loads(content)
+    if "imdata" in original_data and len(original_data["imdata"]) > 0:
+        if "fvTenant" in original_data["imdata"][0]:
+            # Extract tenant attributes from original file
+            return original_data["imdata"][0]["fvTenant"]["attributes"]
+    return None
+
+
+def get_tenant_info_from_data(data):
+    """
+    Get tenant information from already parsed APIC data.
+    
+    Args:
+        data (dict): The nested object data structure built from the APIC JSON file.
+        
+    Returns:
+        dict: The attributes of the first tenant in the data, or None if it has no tenant.
+    """
+    for item in data.get("imdata", []):
+        if "fvTenant" in item:
+            return item["fvTenant"].get("attributes", {})
+    return None
+
+
+def get_tenant_info_from_file(file_path):
+    """
+    Get tenant information from an APIC JSON file without loading the whole file.
+    
+    Args:
+        file_path (str): Path to the APIC JSON file.
+        
+    Returns:
+        dict: The attributes of the first tenant in the file, or None if it has no tenant.
+    """
+    if ijson is None:
+        raise ImportError("ijson is required to read a file without loading it")
+    
+    with open(file_path, 'rb') as file:
+        return next(ijson.items(file, 'imdata.item.fvTenant.attributes', use_float=True), None)
+
+
+def format_result_in_apic_standard(result, tenant_info=None):
     """
     Format the result in the standard APIC format with totalCount and imdata structure.
     Wraps the result(s) in an fvTenant structure, preserving the original tenant attributes.
     
     Args:
         result: The found object, a list of objects, or None if not found
+        tenant_info (dict, optional): The tenant attributes to wrap the result(s) with,
+                                      typically from get_tenant_info_from_data(). When not
+                                      given they are read by get_tenant_info().
     
     Returns:
         dict: A dictionary in standard APIC format with the result(s) wrapped in fvTenant and imdata
@@ -220,11 +534,12 @@ def format_result_in_apic_standard(result):
             "imdata": []
         }
     
-    # Convert single result to a list for uniform handling
-    results_list = result if isinstance(result, list) else [result]
-    
-    # Filter out any None values
-    results_list = [r for r in results_list if r is not None]
+    # Convert single result to a list for uniform handling, and filter out any None
+    # values. The filtered copy is only made when there is a None to drop.
+    if isinstance(result, list):
+        results_list = [r for r in result if r is not None] if None in result else result
+    else:
+        results_list = [result]
     
     if not results_list:
         return {
@@ -232,8 +547,9 @@ def format_result_in_apic_standard(result):
             "imdata": []
         }
     
-    # Get tenant information from the original data
-    tenant_info = get_tenant_info()
+    # Fall back to the tenant information from nested_object.json
+    if tenant_info is None:
+        tenant_info = get_tenant_info()
     
     # Create fvTenant wrapper with children containing all results
     tenant_wrapper = {
@@ -249,16 +565,41 @@ def format_result_in_apic_standard(result):
     }
 
 
-def save_to_json(file_path, data):
+def serialize_to_json(data, indent=True):
+    """
+    Serialize the given data to a JSON document.
+    
+    Uses orjson when it is installed, which encodes large APIC configurations
+    several times faster than the standard library and produces bytes directly.
+    
+    Args:
+        data (dict): The data to be serialized.
+        indent (bool, optional): Indent the document with 2 spaces (the default). A
+                                 compact document is smaller and faster to produce.
+        
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2) if indent else orjson.dumps(data)
+    if indent:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def save_to_json(file_path, data, indent=True):
     """
     Save the given data to a JSON file at the specified file path.
     
+    The document is serialized in one go by serialize_to_json() and written as bytes.
+    
     Args:
         file_path (str): The path where the JSON file should be saved.
         data (dict): The data to be saved as JSON.
+        indent (bool, optional): Indent the document with 2 spaces (the default).
     """
-    with open(file_path, 'w') as json_file:
-        json.dump(data, json_file, indent=2)
+    with open(file_path, 'wb') as json_file:
+        json_file.write(serialize_to_json(data, indent))
 
 
 def set_object_status(results, object_names, status_type):
@@ -276,7 +617,7 @@ def set_object_status(results, object_names, status_type):
     if not results or "imdata" not in results or not results["imdata"]:
         return results
         
-    status_value = "deleted" if status_type == "delete" else "created,modified"
+    status_value = STATUS_VALUES.get(status_type, STATUS_VALUES["create"])
     names_set = set(object_names)
     
     # Loop through each tenant
@@ -287,53 +628,101 @@ def set_object_status(results, object_names, status_type):
                 # Get the first key (object type)
                 for obj_type, obj_data in child.items():
                     # Check if this is an object we want to update
-                    if "attributes" in obj_data and "name" in obj_data["attributes"]:
-                        obj_name = obj_data["attributes"]["name"]
-                        if obj_name in names_set:
-                            # Set the status attribute
-                            obj_data["attributes"]["status"] = status_value
-                            logger.info(f"Set status '{status_value}' for {obj_type} '{obj_name}'")
+                    obj_name = _get_name(obj_data)
+                    if obj_name is not None and obj_name in names_set:
+                        # Set the status attribute
+                        obj_data["attributes"]["status"] = status_value
+                        logger.info("Set status '%s' for %s '%s'", status_value, obj_type, obj_name)
                             
     return results
 
 
-def find_ap_and_children_by_name(data, ap_name):
+def update_status_by_name(data, object_type, names_list, status_type):
+    """
+    Find ALL objects matching the type and ANY of the names, and set their status.
+    
+    This combines find_all_objects_by_name_iterative and set_object_status: the status
+    is set directly on the matches found by the search, so the formatted results do
+    not have to be scanned again. The objects are modified in place, so pass a copy
+    if the data is shared.
+    
+    Args:
+        data (dict or list): The nested dictionary/list structure to search within.
+        object_type (str): The dictionary key identifying the object type (e.g., 'fvBD').
+        names_list (list): A list of 'name' attribute values to match (e.g., ['BD_484', 'BD_721']).
+        status_type (str): Status to set - either 'create' or 'delete'
+        
+    Returns:
+        list: A list containing all matching objects found [{key: value}, ...], with
+              their status set. Returns an empty list ([]) if no matches are found.
+    """
+    status_value = STATUS_VALUES.get(status_type, STATUS_VALUES["create"])
+    found_objects = find_all_objects_by_name_iterative(data, object_type, names_list)
+    
+    for obj in found_objects:
+        attributes = obj[object_type]["attributes"]
+        attributes["status"] = status_value
+        logger.info("Set status '%s' for %s '%s'", status_value, object_type, attributes['name'])
+    
+    return found_objects
+
+
+def find_ap_and_children_by_name(data, ap_name, index=None):
     """
     Find an Application Profile (fvAp) by name along with all its nested children structure.
     
     Args:
-        data (dict): The nested dictionary/list structure to search within.
+        data (dict or list): The nested dictionary/list structure to search within.
         ap_name (str): The name of the Application Profile to find.
+        index (dict, optional): An index built by build_index(data). When given, the
+                                Application Profile is looked up instead of walking the data.
         
     Returns:
         dict: The found Application Profile with all its nested children, or None if not found.
     """
-    # Stack holds tuples of (object, key) to explore
-    stack = [(data, None)]  # Start with the root object, no key yet
-    
-    logger.info(f"Searching for Application Profile with name '{ap_name}'")
+    if index is not None:
+        matches = index.get(("fvAp", ap_name))
+        if matches:
+            return matches[0]
+        logger.info("No Application Profile with name '%s' found in the index.", ap_name)
+        return None
+    
+    # Stack holds the dicts to explore, starting with the root dict(s)
+    stack = _root_dicts(data)
+    push = stack.append
+    pop = stack.pop
+    _type = type
+    _dict = dict
+    _list = list
+    
+    logger.info("Searching for Application Profile with name '%s'", ap_name)
     
     while stack:
-        current_obj, parent_key = stack.pop()  # Get the next object to check
+        current_obj = pop()  # Get the next object to check
         
-        if isinstance(current_obj, dict):
-            for key, value in current_obj.items():
+        for key, value in current_obj.items():
+            # Attribute dicts only hold scalar values, there is nothing to find inside them
+            if key == "attributes":
+                continue
+            # Parsed JSON only contains exact dicts and lists, so checking the type by
+            # identity is enough and cheaper than isinstance()
+            value_type = _type(value)
+            if value_type is _dict:
                 # Check if this is an Application Profile
-                if key == "fvAp" and "attributes" in value:
-                    if value["attributes"].get("name") == ap_name:
-                        logger.debug(f"Found Application Profile: '{ap_name}'")
+                if key == "fvAp":
+                    if _get_name(value) == ap_name:
+                        logger.debug("Found Application Profile: '%s'", ap_name)
                         return {key: value}  # Found it, return the full object with children
-                # Add nested dictionaries to the stack
-                if isinstance(value, (dict, list)):
-                    stack.append((value, key))
-        
-        elif isinstance(current_obj, list):
-            # Add each item in the list to the stack
-            for item in current_obj:
-                if isinstance(item, (dict, list)):
-                    stack.append((item, None))  # No key for list items
-    
-    logger.info(f"No Application Profile with name '{ap_name}' found.")
+                    # An Application Profile never contains another one
+                    continue
+                # Add nested dictionaries to the stack, and the dicts of nested lists directly
+                push(value)
+            elif value_type is _list:
+                for item in value:
+                    if _type(item) is _dict:
+                        push(item)
+    
+    logger.info("No Application Profile with name '%s' found.", ap_name)
     return None  # Not found
 
 
@@ -366,11 +755,16 @@ def get_nested_epgs_from_ap(ap_data):
 def set_status_for_nested_objects(results, object_paths, status_type):
     """
     Set the status attribute for specific objects in the results including nested objects.
-    Supports setting status for objects identified by paths like "fvAp:AppName/fvAEPg:EpgName"
+    Supports setting status for objects identified by paths like "fvAp:AppName/fvAEPg:EpgName",
+    or by the same path given as (type, name) pairs, e.g. (("fvAp", "AppName"), ("fvAEPg", "EpgName")).
+    
+    The paths are compiled once into a plan tree by _compile_paths, which is then
+    applied to the children of each tenant in a single walk per level.
     
     Args:
         results (dict): The formatted APIC results dictionary
-        object_paths (list): List of object paths to update (e.g., ["fvAp:WebApp", "fvAp:WebApp/fvAEPg:WebEPG"])
+        object_paths (list): List of object paths to update (e.g., ["fvAp:WebApp", "fvAp:WebApp/fvAEPg:WebEPG"]),
+                             each either a path string or a sequence of (type, name) pairs
         status_type (str): Status to set - either 'create' or 'delete'
         
     Returns:
@@ -379,134 +773,155 @@ def set_status_for_nested_objects(results, object_paths, status_type):
     if not results or "imdata" not in results or not results["imdata"]:
         return results
         
-    status_value = "deleted" if status_type == "delete" else "created,modified"
-    
-    # Organize paths by their structure
-    top_level_paths = []
-    nested_paths = {}
-    
-    for path in object_paths:
-        path_parts = path.split("/")
-        if len(path_parts) == 1:
-            # This is a top-level object (e.g., "fvAp:WebServer")
-            top_level_paths.append(path)
-        else:
-            # This is a nested path (e.g., "fvAp:WebServer/fvAEPg:EPG_123")
-            root_part = path_parts[0]
-            if root_part not in nested_paths:
-                nested_paths[root_part] = []
-            nested_paths[root_part].append(path_parts[1:])
+    status_value = STATUS_VALUES.get(status_type, STATUS_VALUES["create"])
+    plan = _compile_paths(object_paths)
     
     # Process each tenant
     for tenant in results["imdata"]:
         if "fvTenant" in tenant and "children" in tenant["fvTenant"]:
-            tenant_children = tenant["fvTenant"]["children"]
-            
-            # First process all top-level paths
-            for path in top_level_paths:
-                if ":" in path:
-                    obj_type, obj_name = path.split(":")
-                    
-                    # Look for the top-level object
-                    for child in tenant_children:
-                        if obj_type in child and "attributes" in child[obj_type]:
-                            if child[obj_type]["attributes"].get("name") == obj_name:
-                                # Set status on the top-level object
-                                child[obj_type]["attributes"]["status"] = status_value
-                                logger.info(f"Set status '{status_value}' for {obj_type} '{obj_name}'")
-                                break
-            
-            # Then process all nested paths
-            for root_path, child_paths in nested_paths.items():
-                if ":" in root_path:
-                    obj_type, obj_name = root_path.split(":")
-                    
-                    # Find the parent object
-                    for child in tenant_children:
-                        if obj_type in child and "attributes" in child[obj_type]:
-                            if child[obj_type]["attributes"].get("name") == obj_name:
-                                # We found the parent, now process its children
-                                # Note: We do NOT set status on the parent for nested paths
-                                if "children" in child[obj_type]:
-                                    for nested_path in child_paths:
-                                        _process_nested_path_only(child[obj_type]["children"], nested_path, status_value)
-                                break
+            _apply_status_plan(tenant["fvTenant"]["children"], plan, status_value)
     
     return results
 
 
-def _process_nested_path_only(children, path_parts, status_value):
+def _compile_paths(object_paths):
     """
-    Helper function to process nested paths for setting status attributes
-    without modifying parent objects.
+    Helper function to compile object paths into a plan tree for _apply_status_plan.
+    
+    Each level maps (object type, object name) to a [set_status, children_plan] pair,
+    e.g. ["fvAp:W", "fvAp:W/fvAEPg:E"] becomes
+    {('fvAp', 'W'): [True, {('fvAEPg', 'E'): [True, {}]}]}. Nested objects always get
+    the status, while the parent at the start of a nested path only gets it when it
+    is also given as a path of its own. A path stops at the first part without ':'.
+    Paths given as (type, name) pairs are used as they are, without being split.
+    
+    Args:
+        object_paths (list): List of object paths (e.g., ["fvAp:WebApp/fvAEPg:WebEPG"] or
+                             [(("fvAp", "WebApp"), ("fvAEPg", "WebEPG"))])
+        
+    Returns:
+        dict: The plan tree for the top-level objects
+    """
+    plan = {}
+    for path in object_paths:
+        path_parts = path.split("/") if isinstance(path, str) else path
+        level = plan
+        for depth, part in enumerate(path_parts):
+            if isinstance(part, str):
+                obj_type, separator, obj_name = part.partition(":")
+                if not separator:
+                    break
+            else:
+                obj_type, obj_name = part
+            node = level.get((obj_type, obj_name))
+            if node is None:
+                node = level[(obj_type, obj_name)] = [False, {}]
+            if depth > 0 or len(path_parts) == 1:
+                node[0] = True
+            level = node[1]
+    return plan
+
+
+def _apply_status_plan(children, plan, status_value):
+    """
+    Helper function to set status attributes on the objects of a plan tree built by
+    _compile_paths. Each planned object is matched to the first child with its type
+    and name, and its own plan is then applied to that child's children. Levels are
+    processed iteratively with a stack of (children, plan) pairs.
     
     Args:
         children (list): The children array to search through
-        path_parts (list): Remaining parts of the object path
+        plan (dict): The plan tree for this level
         status_value (str): Status value to set
     """
-    if not path_parts or not children:
-        return
-        
-    # Get the current part to process
-    if ":" in path_parts[0]:
-        obj_type, obj_name = path_parts[0].split(":")
+    stack = [(children, plan)]
+    
+    while stack:
+        children, plan = stack.pop()
+        if not plan or not children:
+            continue
         
-        # Look for the object in children
+        # Planned objects still to be found at this level
+        remaining = dict(plan)
         for child in children:
-            if obj_type in child and "attributes" in child[obj_type]:
-                if child[obj_type]["attributes"].get("name") == obj_name:
-                    # Set status on this object
-                    child[obj_type]["attributes"]["status"] = status_value
-                    logger.info(f"Set status '{status_value}' for {obj_type} '{obj_name}'")
-                    
-                    # Continue with next level if exists
-                    if len(path_parts) > 1 and "children" in child[obj_type]:
-                        _process_nested_path_only(child[obj_type]["children"], path_parts[1:], status_value)
-                    
-                    break
+            for obj_type, obj_data in child.items():
+                obj_name = _get_name(obj_data)
+                if obj_name is None:
+                    continue
+                node = remaining.pop((obj_type, obj_name), None)
+                if node is None:
+                    continue
+                
+                set_status, children_plan = node
+                if set_status:
+                    obj_data["attributes"]["status"] = status_value
+                    logger.info("Set status '%s' for %s '%s'", status_value, obj_type, obj_name)
+                
+                # Continue with the next level if there is one
+                if children_plan and "children" in obj_data:
+                    stack.append((obj_data["children"], children_plan))
+            
+            if not remaining:
+                break
 
 
 def get_ap_and_epg_names(data):
     """
     Get all Application Profiles and their EPGs from the data.
     
+    Only the APIC containers are followed: the imdata list at the root and the
+    "children" list of each object. Attribute dicts are never visited, and the
+    search does not go below an Application Profile, whose EPGs are read directly
+    from its children.
+    
     Args:
-        data (dict): The nested object data structure
+        data (dict or list): The nested object data structure, or its imdata list
         
     Returns:
         dict: A dictionary where keys are AP names and values are lists of their EPG names
     """
     ap_epg_dict = {}
-    stack = [(data, None)]
+    # Stack holds the root dict(s) and the {object_type: object} dicts found in children lists
+    stack = _root_dicts(data)
+    push = stack.append
+    pop = stack.pop
+    _type = type
+    _dict = dict
+    _list = list
     
     while stack:
-        current_obj, _ = stack.pop()
+        current_obj = pop()
         
-        if isinstance(current_obj, dict):
-            # Check if this is an Application Profile
-            if "fvAp" in current_obj and "attributes" in current_obj["fvAp"]:
-                ap_name = current_obj["fvAp"]["attributes"].get("name")
-                if ap_name:
-                    ap_epg_dict[ap_name] = []
-                    
-                    # Look for EPGs in this AP's children
-                    if "children" in current_obj["fvAp"]:
-                        for child in current_obj["fvAp"]["children"]:
-                            if "fvAEPg" in child and "attributes" in child["fvAEPg"]:
-                                epg_name = child["fvAEPg"]["attributes"].get("name")
-                                if epg_name:
-                                    ap_epg_dict[ap_name].append(epg_name)
+        for key, value in current_obj.items():
+            value_type = _type(value)
+            if value_type is _dict:
+                if key == "fvAp":
+                    # Check if this is an Application Profile with a name
+                    ap_name = _get_name(value)
+                    if ap_name:
+                        ap_epg_dict[ap_name] = []
+                        
+                        # Look for EPGs in this AP's children
+                        if "children" in value:
+                            for child in value["children"]:
+                                epg = child.get("fvAEPg")
+                                if epg is not None:
+                                    epg_name = _get_name(epg)
+                                    if epg_name:
+                                        ap_epg_dict[ap_name].append(epg_name)
+                    # An Application Profile never contains another one
+                    continue
+                children = value.get("children")
+            elif value_type is _list and key == "imdata":
+                children = value
+            else:
+                continue
             
             # Continue searching deeper
-            for key, value in current_obj.items():
-                if isinstance(value, (dict, list)):
-                    stack.append((value, key))
-                    
-        elif isinstance(current_obj, list):
-            for item in current_obj:
-                if isinstance(item, (dict, list)):
-                    stack.append((item, None))
+            if _type(children) is _list:
+                for item in children:
+                    if _type(item) is _dict:
+                        push(item)
     
     return ap_epg_dict
 
@@ -534,5 +949,5 @@ if __name__ == "__main__":
     for child in top_level_objects:
         for key, value in child.items():
             if key != "children":
-                logger.info(f"Object: {key}, Name: {value}")
+                logger.info("Object: %s, Name: %s", key, value)
 
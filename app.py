@@ -10,23 +10,26 @@ Usage:
 """
 
 import streamlit as st
-import json
+import copy
 import os
-import tempfile
 import pandas as pd
 import logging
 import sys
 from apic_parser.apic_parser import (
     build_nested_object,
+    build_index,
     get_top_level_objects,
     find_object_by_name_iterative,
     find_all_objects_by_name_iterative,
     format_result_in_apic_standard,
+    get_tenant_info_from_data,
     set_object_status,
     find_ap_and_children_by_name,
     get_nested_epgs_from_ap,
     set_status_for_nested_objects,
-    get_ap_and_epg_names
+    get_ap_and_epg_names,
+    serialize_to_json,
+    STATUS_VALUES
 )
 
 # Configure logging
@@ -72,41 +75,133 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Raw JSON views larger than this (in bytes) are shown truncated instead of in the tree viewer
+RAW_JSON_PREVIEW_LIMIT = 512 * 1024
+
+# Results larger than this (in bytes) are shown as highlighted text instead of in the tree viewer
+RESULT_TREE_VIEW_LIMIT = 256 * 1024
+
 # Define functions for the app
 def process_uploaded_file(uploaded_file):
-    """Process the uploaded JSON file and return the parsed data"""
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.json') as tmp_file:
-        tmp_file.write(uploaded_file.getvalue())
-        tmp_file_path = tmp_file.name
+    """Process the uploaded JSON file and return the parsed data
     
+    The upload is parsed straight from memory, without a round trip through a temp file.
+    """
     try:
         logger.info(f"Processing uploaded file: {uploaded_file.name}")
-        parsed_data = build_nested_object(tmp_file_path)
-        os.unlink(tmp_file_path)  # Clean up the temp file
-        return parsed_data
+        uploaded_file.seek(0)
+        return build_nested_object(uploaded_file)
     except Exception as e:
         logger.error(f"Error parsing the uploaded file: {e}")
-        os.unlink(tmp_file_path)  # Clean up the temp file
         st.error(f"Error parsing the uploaded file: {e}")
         return None
 
-def display_top_level_objects_table(data):
-    """Display the top-level objects in a table format"""
-    top_level = get_top_level_objects(data)
+@st.cache_data(show_spinner=False, max_entries=8)
+def get_top_level_summary(file_id, _data):
+    """Get the (object type, name) pairs of the top-level objects, computed once per uploaded file
+    
+    The leading underscore keeps the parsed data out of Streamlit's cache key,
+    so the cache is keyed on the uploaded file's id alone.
+    """
+    summary = []
+    for obj in get_top_level_objects(_data):
+        for key, value in obj.items():
+            if key != "children":
+                summary.append((key, value))
+    return summary
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def get_serialized_config(file_id, _data):
+    """Serialize the parsed configuration once per uploaded file"""
+    return serialize_to_json(_data)
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def get_parsed_upload(file_id, _uploaded_file):
+    """Parse an uploaded file once per upload, so reruns reuse the same parsed data
+    
+    st.cache_resource hands back the cached object itself rather than a copy,
+    so callers must copy anything they are going to modify.
+    """
+    return process_uploaded_file(_uploaded_file)
+
+def get_top_level_subtree(data, position):
+    """Get the top-level object at the given position of the top-level summary"""
+    for item in data.get("imdata", ()):
+        tenant = item.get("fvTenant")
+        if tenant is None:
+            continue
+        for child in tenant.get("children") or ():
+            if position < len(child):
+                return child
+            position -= len(child)
+    return None
+
+@st.fragment
+def display_raw_json(file_id, data, file_name, top_level_summary):
+    """Display the raw JSON of one top-level object, or of the whole configuration
+    
+    Runs as a fragment, so picking another object only reruns this view. Only the
+    selected subtree is sent to the browser; the whole configuration is truncated
+    when it is too large for the tree viewer and can always be downloaded.
+    """
+    # Option to view JSON structure, collapsed so only the nodes the user expands are rendered
+    if not st.checkbox("Show Raw JSON Structure"):
+        return
+    
+    payload = get_serialized_config(file_id, data)
+    st.download_button(
+        label="📥 Download Full JSON",
+        data=payload,
+        file_name=file_name,
+        mime="application/json"
+    )
+    
+    position = st.selectbox(
+        "Object to show",
+        options=range(-1, len(top_level_summary)),
+        format_func=lambda i: "Whole configuration" if i < 0 else f"{top_level_summary[i][0]}: {top_level_summary[i][1]}"
+    )
+    
+    if position >= 0:
+        st.json(get_top_level_subtree(data, position), expanded=False)
+        return
+    
+    if len(payload) <= RAW_JSON_PREVIEW_LIMIT:
+        st.json(data, expanded=False)
+        return
+    
+    st.warning(f"The configuration is {len(payload) // 1024} KB, showing the first {RAW_JSON_PREVIEW_LIMIT // 1024} KB only.")
+    preview = payload[:RAW_JSON_PREVIEW_LIMIT].decode('utf-8', errors='ignore')
+    st.code(preview + "\n... (truncated, download for the full JSON)", language="json")
+
+def display_results(results):
+    """Display search results and return them serialized for download
     
-    if not top_level:
+    The results are serialized once. Large results are shown from that text with
+    st.code, since st.json re-serializes them and its tree viewer is slow to render.
+    """
+    payload = serialize_to_json(results)
+    
+    with st.expander("View Results", expanded=True):
+        if len(payload) <= RESULT_TREE_VIEW_LIMIT:
+            st.json(results)
+        else:
+            st.code(payload.decode('utf-8'), language="json")
+    
+    return payload
+
+def display_top_level_objects_table(top_level_summary):
+    """Display the top-level objects in a table format"""
+    if not top_level_summary:
         st.warning("No top-level objects found in the uploaded file.")
         return
     
-    # Prepare data for the table
-    table_data = []
-    for obj in top_level:
-        for key, value in obj.items():
-            if key != "children":
-                table_data.append({"Object Type": key, "Name": value})
+    # Prepare column data for the table
+    object_types = [object_type for object_type, _ in top_level_summary]
+    names = [name for _, name in top_level_summary]
     
-    # Create DataFrame
-    df = pd.DataFrame(table_data)
+    # Create DataFrame column-wise, avoiding per-row dict construction
+    df = pd.DataFrame({"Object Type": object_types, "Name": names})
     
     # Display the table with improved formatting
     st.dataframe(
@@ -125,43 +220,52 @@ def display_top_level_objects_table(data):
         use_container_width=True
     )
 
-def search_objects(data, object_type, object_names, status_type=None):
-    """Search for objects by type and names"""
-    if not object_type or not object_names:
+@st.cache_resource(show_spinner=False, max_entries=4)
+def get_object_index(file_id, _data):
+    """Index the parsed objects by type and name, once per uploaded file
+    
+    Uses st.cache_resource so the index is shared rather than copied on every
+    access, which means the indexed objects must not be mutated by callers.
+    """
+    return build_index(_data)
+
+def search_objects(data, object_type, names_list, status_type=None, index=None):
+    """Search for objects by type and a list of names, using the object index when given"""
+    if not object_type or not names_list:
         logger.warning("Search attempted without providing both object type and name(s)")
         st.warning("Please provide both object type and name(s).")
         return None
     
-    # Parse object names (handle comma-separated values)
-    names_list = [name.strip() for name in object_names.split(',')]
-    
     with st.spinner(f"Searching for objects of type '{object_type}'..."):
         logger.info(f"Searching for object type '{object_type}' with names: {names_list}")
         if len(names_list) > 1:
-            results = find_all_objects_by_name_iterative(data, object_type, names_list)
+            results = find_all_objects_by_name_iterative(data, object_type, names_list, index=index)
         else:
-            result = find_object_by_name_iterative(data, object_type, names_list[0])
+            result = find_object_by_name_iterative(data, object_type, names_list[0], index=index)
             results = [result] if result else []
         
         # Format results in APIC standard format
-        formatted_results = format_result_in_apic_standard(results)
+        formatted_results = format_result_in_apic_standard(results, get_tenant_info_from_data(data))
         
         # Apply status if requested
         if status_type and formatted_results and formatted_results["totalCount"] != "0":
             logger.info(f"Setting status '{status_type}' for found objects")
+            # The found objects are shared with the cached index, so set status on a copy
+            formatted_results = copy.deepcopy(formatted_results)
             formatted_results = set_object_status(formatted_results, names_list, status_type)
         
     return formatted_results if results else None
 
-def search_ap_with_children(data, ap_name, status_type=None, nested_paths=None, only_update_nested=False):
+def search_ap_with_children(data, ap_name, status_type=None, nested_paths=None, only_update_nested=False, index=None):
     """Search for Application Profile with all its nested children
     
     Args:
         data: The parsed data
         ap_name: Name of the Application Profile
         status_type: Status type to set (create or delete)
-        nested_paths: List of object paths to update status
+        nested_paths: List of object paths to update status, as sequences of (type, name) pairs
         only_update_nested: If True, don't set status on the AP itself even if it's in nested_paths
+        index: The object index of the data, used to look up the AP instead of walking the data
         
     Returns:
         The formatted results with updated status
@@ -173,18 +277,20 @@ def search_ap_with_children(data, ap_name, status_type=None, nested_paths=None,
     
     with st.spinner(f"Searching for Application Profile '{ap_name}'..."):
         logger.info(f"Searching for Application Profile: {ap_name}")
-        result = find_ap_and_children_by_name(data, ap_name)
+        result = find_ap_and_children_by_name(data, ap_name, index=index)
         
         # Format results in APIC standard format
-        formatted_results = format_result_in_apic_standard(result)
+        formatted_results = format_result_in_apic_standard(result, get_tenant_info_from_data(data))
         
         # Apply status to AP and nested objects if requested
         if status_type and formatted_results and formatted_results["totalCount"] != "0":
+            # The found AP is part of the cached parsed data, so set status on a copy
+            formatted_results = copy.deepcopy(formatted_results)
             if nested_paths:
                 logger.info(f"Setting status '{status_type}' for nested objects in paths: {nested_paths}")
                 # If only_update_nested is True, filter out the AP path if present
                 if only_update_nested:
-                    nested_paths = [p for p in nested_paths if not p.startswith(f"fvAp:{ap_name}$")]
+                    nested_paths = [p for p in nested_paths if tuple(p) != (("fvAp", ap_name),)]
                 
                 formatted_results = set_status_for_nested_objects(formatted_results, nested_paths, status_type)
             else:
@@ -194,29 +300,166 @@ def search_ap_with_children(data, ap_name, status_type=None, nested_paths=None,
     
     return formatted_results if result else None
 
-def get_available_object_types(data):
-    """Get a list of all available object types from the data"""
-    top_level = get_top_level_objects(data)
-    object_types = []
+@st.cache_data(show_spinner=False, max_entries=8)
+def get_cached_ap_and_epg_names(file_id, _data):
+    """Get all Application Profiles and their EPGs, walking the data only once per uploaded file"""
+    return get_ap_and_epg_names(_data)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def get_names_by_type(file_id, _top_level_summary):
+    """Index the top-level object names by object type, once per uploaded file
     
-    for obj in top_level:
-        for key in obj.keys():
-            if key != "children" and key not in object_types:
-                object_types.append(key)
+    Types and names are sorted here, so the sorted option lists are reused
+    across reruns instead of being re-sorted each time.
+    """
+    names_by_type = {}
+    
+    for key, value in _top_level_summary:
+        names = names_by_type.setdefault(key, [])
+        if value is not None:
+            names.append(value)
     
-    return sorted(object_types)
+    return {key: sorted(names_by_type[key]) for key in sorted(names_by_type)}
+
+def get_available_object_types(names_by_type):
+    """Get a sorted list of all available object types from the names index"""
+    return list(names_by_type)
+
+def get_object_names_by_type(names_by_type, object_type):
+    """Get the sorted object names of a specific type from the names index"""
+    return names_by_type.get(object_type, [])
 
-def get_object_names_by_type(data, object_type):
-    """Get all object names of a specific type"""
-    top_level = get_top_level_objects(data)
-    names = []
+@st.fragment
+def render_ap_tab():
+    """Render the Application Profiles tab
     
-    for obj in top_level:
-        for key, value in obj.items():
-            if key == object_type and value is not None:
-                names.append(value)
+    Runs as a fragment, so picking an Application Profile or submitting the status
+    form only reruns this tab instead of the whole app.
+    """
+    st.header("Browse Application Profiles and EPGs")
+    st.info("This tab helps you work with nested objects like Application Profiles (fvAp) and their EPGs (fvAEPg)")
+    
+    # Get all Application Profiles and their EPGs
+    with st.spinner("Loading Application Profiles and EPGs..."):
+        ap_epg_dict = get_cached_ap_and_epg_names(
+            st.session_state.uploaded_file_id,
+            st.session_state.parsed_data
+        )
     
-    return sorted(names)
+    if not ap_epg_dict:
+        st.warning("No Application Profiles found in the configuration.")
+    else:
+        # Show Application Profiles in a dropdown
+        ap_names = list(ap_epg_dict.keys())
+        selected_ap = st.selectbox("Select Application Profile", options=[""] + ap_names)
+        
+        if selected_ap:
+            # Show EPGs for the selected AP
+            st.subheader(f"EPGs in {selected_ap}")
+            epgs = ap_epg_dict[selected_ap]
+            
+            if not epgs:
+                st.info(f"No EPGs found in Application Profile '{selected_ap}'")
+            else:
+                # Display EPGs in a table
+                epg_df = pd.DataFrame({"EPG Name": epgs})
+                st.dataframe(
+                    epg_df,
+                    hide_index=True,
+                    use_container_width=True
+                )
+                
+                # Batch the EPG selection and status widgets in a form so that
+                # toggling them does not rerun the app until the form is submitted
+                with st.form("ap_status_form"):
+                    # Allow selection of EPGs
+                    selected_epgs = st.multiselect(
+                        "Select EPGs to include in status update", 
+                        options=epgs
+                    )
+                    
+                    # Status setting options for nested objects
+                    st.subheader("Set Status for Objects")
+                    
+                    status_options = st.columns(3)
+                    with status_options[0]:
+                        set_ap_status = st.checkbox("Set AP Status", help="Set status for the Application Profile", key="ap_set_status")
+                    
+                    with status_options[1]:
+                        set_epg_status = st.checkbox("Set EPG Status", help="Set status for selected EPGs", key="epg_set_status")
+                        
+                    with status_options[2]:
+                        status_type = st.radio(
+                            "Status Type", 
+                            ["create", "delete"], 
+                            horizontal=True,
+                            help="'create' sets status to 'created,modified', 'delete' sets status to 'deleted'",
+                            key="ap_status_type"
+                        )
+                    
+                    # Button to retrieve AP with status updates
+                    retrieve_button = st.form_submit_button(
+                        "📋 Retrieve with Status Updates", 
+                        type="primary"
+                    )
+                
+                # Form widget values are only known on submit, so validate here
+                # instead of disabling the button
+                if retrieve_button and not (set_ap_status or (set_epg_status and selected_epgs)):
+                    st.warning("Select 'Set AP Status', or 'Set EPG Status' with at least one EPG.")
+                elif retrieve_button:
+                    # Build paths for status updates
+                    object_paths = []
+                    
+                    if set_ap_status:
+                        object_paths.append((("fvAp", selected_ap),))
+                        
+                    if set_epg_status and selected_epgs:
+                        for epg in selected_epgs:
+                            object_paths.append((("fvAp", selected_ap), ("fvAEPg", epg)))
+                    
+                    # Retrieve AP with nested children and set status
+                    with st.spinner(f"Retrieving Application Profile '{selected_ap}' and updating status..."):
+                        object_index = get_object_index(st.session_state.uploaded_file_id, st.session_state.parsed_data)
+                        results = search_ap_with_children(
+                            st.session_state.parsed_data,
+                            selected_ap,
+                            status_type=status_type if (set_ap_status or set_epg_status) else None,
+                            nested_paths=object_paths,
+                            only_update_nested=set_epg_status and not set_ap_status,
+                            index=object_index
+                        )
+                        
+                        if results:
+                            # Show what objects had status set
+                            if set_ap_status or set_epg_status:
+                                status_value = STATUS_VALUES.get(status_type, STATUS_VALUES["create"])
+                                objects_updated = []
+                                
+                                if set_ap_status:
+                                    objects_updated.append(f"Application Profile '{selected_ap}'")
+                                    
+                                if set_epg_status and selected_epgs:
+                                    for epg in selected_epgs:
+                                        objects_updated.append(f"EPG '{epg}'")
+                                
+                                st.success(f"Status set to '{status_value}' for {len(objects_updated)} object(s)")
+                                st.write("Updated objects:")
+                                for obj in objects_updated:
+                                    st.write(f"- {obj}")
+                            
+                            # Show results
+                            result_json = display_results(results)
+                            
+                            # Download button for results
+                            st.download_button(
+                                label="📥 Download Results",
+                                data=result_json,
+                                file_name=f"ap_{selected_ap}_with_status.json",
+                                mime="application/json"
+                            )
+                        else:
+                            st.error(f"Failed to retrieve Application Profile '{selected_ap}'")
 
 # Main app structure
 def main():
@@ -236,10 +479,11 @@ def main():
         if uploaded_file is not None:
             st.success(f"File uploaded: {uploaded_file.name}")
             st.session_state.uploaded_file_name = uploaded_file.name
+            st.session_state.uploaded_file_id = uploaded_file.file_id
             
             # Process uploaded file
             with st.spinner("Processing file..."):
-                parsed_data = process_uploaded_file(uploaded_file)
+                parsed_data = get_parsed_upload(uploaded_file.file_id, uploaded_file)
                 if parsed_data:
                     st.session_state.parsed_data = parsed_data
                     st.session_state.file_processed = True
@@ -258,6 +502,12 @@ def main():
     
     # Main content area - Tabs
     if 'file_processed' in st.session_state and st.session_state.file_processed:
+        top_level_summary = get_top_level_summary(
+            st.session_state.uploaded_file_id,
+            st.session_state.parsed_data
+        )
+        names_by_type = get_names_by_type(st.session_state.uploaded_file_id, top_level_summary)
+        
         # Use session state to control active tab
         tab1, tab2, tab3, tab4 = st.tabs(["📊 Overview", "🔍 Search", "🌳 Application Profiles", "ℹ️ About"])
         
@@ -265,51 +515,48 @@ def main():
         with tab1:
             st.header(f"Configuration Overview: {st.session_state.uploaded_file_name}")
             st.subheader("Top-Level Objects")
-            display_top_level_objects_table(st.session_state.parsed_data)
+            display_top_level_objects_table(top_level_summary)
             
-            # Option to view JSON structure
-            if st.checkbox("Show Raw JSON Structure"):
-                st.json(st.session_state.parsed_data)
+            display_raw_json(
+                st.session_state.uploaded_file_id,
+                st.session_state.parsed_data,
+                st.session_state.uploaded_file_name,
+                top_level_summary
+            )
         
         # Tab 2: Search
         with tab2:
             st.header("Search for Objects")
             
             # Get available object types for dropdown
-            object_types = [""] + get_available_object_types(st.session_state.parsed_data)
+            object_types = [""] + get_available_object_types(names_by_type)
             
-            col1, col2 = st.columns([1, 2])
-            
-            with col1:
-                # Use dropdown with available types
-                object_type = st.selectbox(
-                    "Object Type",
-                    options=object_types,
-                    index=0
-                )
+            # The type dropdown stays outside the form, since the name options depend on it
+            object_type = st.selectbox(
+                "Object Type",
+                options=object_types,
+                index=0
+            )
             
-            with col2:
+            # Batch the name selection and status widgets in a form so that
+            # toggling them does not rerun the app until the form is submitted
+            with st.form("search_form"):
                 # If an object type is selected, get names for that type and show as a multiselect
                 if object_type:
-                    object_names_list = get_object_names_by_type(st.session_state.parsed_data, object_type)
                     selected_names = st.multiselect(
                         "Select Object Name(s)",
-                        options=object_names_list,
+                        options=get_object_names_by_type(names_by_type, object_type),
                         help="You can select multiple objects of the same type"
                     )
-                    
-                    # Convert selected names to comma-separated string for the search function
-                    object_names = ",".join(selected_names) if selected_names else ""
                 else:
-                    object_names = ""
+                    selected_names = []
                     st.text("Please select an Object Type first")
-            
-            # Status setting options
-            status_col1, status_col2 = st.columns([1, 2])
-            with status_col1:
-                set_status = st.checkbox("Set Status", help="Set status for found objects", key="search_set_status")
-            with status_col2:
-                if set_status:
+                
+                # Status setting options
+                status_col1, status_col2 = st.columns([1, 2])
+                with status_col1:
+                    set_status = st.checkbox("Set Status", help="Set status for found objects", key="search_set_status")
+                with status_col2:
                     status_type = st.radio(
                         "Status Type", 
                         ["create", "delete"], 
@@ -317,27 +564,34 @@ def main():
                         help="'create' sets status to 'created,modified', 'delete' sets status to 'deleted'",
                         key="search_status_type"
                     )
-                else:
-                    status_type = None
-            
-            search_clicked = st.button("🔍 Search", type="primary", disabled=not (object_type and object_names))
+                
+                search_clicked = st.form_submit_button("🔍 Search", type="primary")
             
-            if search_clicked and object_type and object_names:
-                results = search_objects(st.session_state.parsed_data, object_type, object_names, status_type if set_status else None)
+            # Form widget values are only known on submit, so validate here
+            # instead of disabling the button
+            if search_clicked and not (object_type and selected_names):
+                st.warning("Please provide both object type and name(s).")
+            elif search_clicked:
+                object_index = get_object_index(st.session_state.uploaded_file_id, st.session_state.parsed_data)
+                results = search_objects(
+                    st.session_state.parsed_data,
+                    object_type,
+                    selected_names,
+                    status_type if set_status else None,
+                    index=object_index
+                )
                 if results:
                     st.session_state.search_results = results
                     st.success(f"Found {results['totalCount']} object(s)")
                     
                     if set_status:
-                        status_value = "deleted" if status_type == "delete" else "created,modified"
+                        status_value = STATUS_VALUES.get(status_type, STATUS_VALUES["create"])
                         st.info(f"Status set to '{status_value}' for the found object(s)")
                     
                     # Show results
-                    with st.expander("View Results", expanded=True):
-                        st.json(results)
+                    result_json = display_results(results)
                     
                     # Download button for results
-                    result_json = json.dumps(results, indent=2)
                     st.download_button(
                         label="📥 Download Results",
                         data=result_json,
@@ -349,121 +603,7 @@ def main():
         
         # Tab 3: Application Profiles
         with tab3:
-            st.header("Browse Application Profiles and EPGs")
-            st.info("This tab helps you work with nested objects like Application Profiles (fvAp) and their EPGs (fvAEPg)")
-            
-            # Get all Application Profiles and their EPGs
-            with st.spinner("Loading Application Profiles and EPGs..."):
-                ap_epg_dict = get_ap_and_epg_names(st.session_state.parsed_data)
-            
-            if not ap_epg_dict:
-                st.warning("No Application Profiles found in the configuration.")
-            else:
-                # Show Application Profiles in a dropdown
-                ap_names = list(ap_epg_dict.keys())
-                selected_ap = st.selectbox("Select Application Profile", options=[""] + ap_names)
-                
-                if selected_ap:
-                    # Show EPGs for the selected AP
-                    st.subheader(f"EPGs in {selected_ap}")
-                    epgs = ap_epg_dict[selected_ap]
-                    
-                    if not epgs:
-                        st.info(f"No EPGs found in Application Profile '{selected_ap}'")
-                    else:
-                        # Display EPGs in a table
-                        epg_df = pd.DataFrame({"EPG Name": epgs})
-                        st.dataframe(
-                            epg_df,
-                            hide_index=True,
-                            use_container_width=True
-                        )
-                        
-                        # Allow selection of EPGs
-                        selected_epgs = st.multiselect(
-                            "Select EPGs to include in status update", 
-                            options=epgs
-                        )
-                        
-                        # Status setting options for nested objects
-                        st.subheader("Set Status for Objects")
-                        
-                        status_options = st.columns(3)
-                        with status_options[0]:
-                            set_ap_status = st.checkbox("Set AP Status", help="Set status for the Application Profile", key="ap_set_status")
-                        
-                        with status_options[1]:
-                            set_epg_status = st.checkbox("Set EPG Status", help="Set status for selected EPGs", key="epg_set_status")
-                            
-                        with status_options[2]:
-                            status_type = st.radio(
-                                "Status Type", 
-                                ["create", "delete"], 
-                                horizontal=True,
-                                help="'create' sets status to 'created,modified', 'delete' sets status to 'deleted'",
-                                key="ap_status_type"
-                            )
-                        
-                        # Button to retrieve AP with status updates
-                        retrieve_button = st.button(
-                            "📋 Retrieve with Status Updates", 
-                            type="primary",
-                            disabled=not (selected_ap and (set_ap_status or (set_epg_status and selected_epgs)))
-                        )
-                        
-                        if retrieve_button:
-                            # Build paths for status updates
-                            object_paths = []
-                            
-                            if set_ap_status:
-                                object_paths.append(f"fvAp:{selected_ap}")
-                                
-                            if set_epg_status and selected_epgs:
-                                for epg in selected_epgs:
-                                    object_paths.append(f"fvAp:{selected_ap}/fvAEPg:{epg}")
-                            
-                            # Retrieve AP with nested children and set status
-                            with st.spinner(f"Retrieving Application Profile '{selected_ap}' and updating status..."):
-                                results = search_ap_with_children(
-                                    st.session_state.parsed_data,
-                                    selected_ap,
-                                    status_type=status_type if (set_ap_status or set_epg_status) else None,
-                                    nested_paths=object_paths,
-                                    only_update_nested=set_epg_status and not set_ap_status
-                                )
-                                
-                                if results:
-                                    # Show what objects had status set
-                                    if set_ap_status or set_epg_status:
-                                        status_value = "deleted" if status_type == "delete" else "created,modified"
-                                        objects_updated = []
-                                        
-                                        if set_ap_status:
-                                            objects_updated.append(f"Application Profile '{selected_ap}'")
-                                            
-                                        if set_epg_status and selected_epgs:
-                                            for epg in selected_epgs:
-                                                objects_updated.append(f"EPG '{epg}'")
-                                        
-                                        st.success(f"Status set to '{status_value}' for {len(objects_updated)} object(s)")
-                                        st.write("Updated objects:")
-                                        for obj in objects_updated:
-                                            st.write(f"- {obj}")
-                                    
-                                    # Show results
-                                    with st.expander("View Results", expanded=True):
-                                        st.json(results)
-                                    
-                                    # Download button for results
-                                    result_json = json.dumps(results, indent=2)
-                                    st.download_button(
-                                        label="📥 Download Results",
-                                        data=result_json,
-                                        file_name=f"ap_{selected_ap}_with_status.json",
-                                        mime="application/json"
-                                    )
-                                else:
-                                    st.error(f"Failed to retrieve Application Profile '{selected_ap}'")
+            render_ap_tab()
         
         # Tab 4: About
         with tab4:
@@ -472,7 +612,7 @@ def main():
             **APIC Parser** is a tool for parsing and searching through Cisco ACI APIC (Application Policy Infrastructure Controller) JSON configuration files.
             
             ### Features
-            - Parse large APIC JSON configuration files using a streaming parser
+            - Parse large APIC JSON configuration files quickly with a C-accelerated JSON decoder
             - Extract top-level objects from the tenant configuration
             - Search for specific objects by type and name
             - Search for multiple objects in a single command
@@ -481,7 +621,7 @@ def main():
             - Output results in the standard APIC JSON format
             
             ### How It Works
-            1. The tool uses `ijson` to parse APIC JSON files in a streaming manner, which allows it to efficiently handle large files
+            1. The tool decodes APIC JSON files in a single pass with `orjson` (falling back to the standard `json` module), which handles large files efficiently
             2. When searching for objects, the tool traverses the parsed data structure using an iterative depth-first search approach
             3. Results are wrapped in the standard APIC format, preserving the tenant structure and attributes
             4. Status can be set to either 'created,modified' or 'deleted' as required by APIC
@@ -14,9 +14,13 @@ from apic_parser.apic_parser import (
     get_top_level_objects, 
     find_object_by_name_iterative,
     find_all_objects_by_name_iterative, 
+    find_object_streaming,
     save_to_json, 
     format_result_in_apic_standard,
-    set_object_status
+    get_tenant_info_from_data,
+    get_tenant_info_from_file,
+    set_object_status,
+    update_status_by_name
 )
 
 
@@ -100,17 +104,21 @@ def find_objects(data, object_type, object_name_input, output_file=None, status=
     # Parse object names (handle comma-separated values)
     object_names = [name.strip() for name in object_name_input.split(',')]
     
+    # Wrap results with the attributes of the tenant they were found in
+    tenant_info = get_tenant_info_from_data(data)
+    
     if len(object_names) > 1:
-        # Multiple object names - use find_all_objects_by_name_iterative
-        results = find_all_objects_by_name_iterative(data, object_type, object_names)
-        formatted_results = format_result_in_apic_standard(results)
+        # Multiple object names - use find_all_objects_by_name_iterative, or
+        # update_status_by_name to set the status while searching if requested
+        if status:
+            results = update_status_by_name(data, object_type, object_names, status)
+        else:
+            results = find_all_objects_by_name_iterative(data, object_type, object_names)
+        formatted_results = format_result_in_apic_standard(results, tenant_info)
         
         if results:
             print(f"Found {len(results)} object(s) of type '{object_type}'")
-            
-            # Set status if requested
             if status:
-                formatted_results = set_object_status(formatted_results, object_names, status)
                 print(f"Status set to '{status}' for specified objects")
             
             if output_file:
@@ -126,30 +134,86 @@ def find_objects(data, object_type, object_name_input, output_file=None, status=
         # Single object name - use find_object_by_name_iterative
         object_name = object_names[0]
         result = find_object_by_name_iterative(data, object_type, object_name)
-        formatted_result = format_result_in_apic_standard(result)
-        
-        if result:
-            print(f"Found object of type '{object_type}' with name '{object_name}'")
-            
-            # Set status if requested
-            if status:
-                formatted_result = set_object_status(formatted_result, [object_name], status)
-                print(f"Status set to '{status}' for {object_name}")
-            
-            if output_file:
-                save_to_json(output_file, formatted_result)
-                print(f"Object saved to {output_file}")
-            else:
-                print(json.dumps(formatted_result, indent=2))
-            return True
-        else:
-            return False
+        return output_single_object(result, tenant_info, object_type, object_name, output_file, status)
+
+
+def find_object_in_file(file_path, object_type, object_name, output_file=None, status=None):
+    """
+    Find a single object by type and name while streaming the APIC JSON file.
+    
+    The file is never loaded as a whole, which keeps memory use low for large files.
+    
+    Args:
+        file_path (str): Path to the APIC JSON file
+        object_type (str): Type of object to find (e.g., "fvBD")
+        object_name (str): Name of the object to find
+        output_file (str, optional): Path to save the result
+        status (str, optional): Status to set - either 'create' or 'delete'
+    
+    Returns:
+        bool: True if the object was found, False otherwise
+    """
+    result = find_object_streaming(file_path, object_type, object_name)
+    tenant_info = get_tenant_info_from_file(file_path) if result else None
+    return output_single_object(result, tenant_info, object_type, object_name, output_file, status)
+
+
+def output_single_object(result, tenant_info, object_type, object_name, output_file=None, status=None):
+    """
+    Format, optionally set the status of, and print or save a single found object.
+    
+    Args:
+        result (dict): The found object, or None if it was not found
+        tenant_info (dict): The tenant attributes to wrap the object with
+        object_type (str): Type of the object (e.g., "fvBD")
+        object_name (str): Name of the object
+        output_file (str, optional): Path to save the result
+        status (str, optional): Status to set - either 'create' or 'delete'
+    
+    Returns:
+        bool: True if the object was found, False otherwise
+    """
+    if not result:
+        return False
+    
+    formatted_result = format_result_in_apic_standard(result, tenant_info)
+    print(f"Found object of type '{object_type}' with name '{object_name}'")
+    
+    # Set status if requested
+    if status:
+        formatted_result = set_object_status(formatted_result, [object_name], status)
+        print(f"Status set to '{status}' for {object_name}")
+    
+    if output_file:
+        save_to_json(output_file, formatted_result)
+        print(f"Object saved to {output_file}")
+    else:
+        print(json.dumps(formatted_result, indent=2))
+    return True
 
 
 def main():
     """Main entry point for the APIC Parser tool."""
     args = parse_arguments()
     
+    # A single object below the tenant can be found without building the whole nested
+    # object. Tenants, and objects not found below them, are searched in the nested object.
+    if (args.find_object and not args.get_top_level and args.object_type and args.object_name
+            and ',' not in args.object_name and args.object_type != "fvTenant"):
+        try:
+            if find_object_in_file(args.json_file_path, args.object_type, args.object_name.strip(),
+                                   args.output_file, args.set_status):
+                return
+        except ImportError:
+            # ijson is not installed, fall back to building the nested object
+            pass
+        except FileNotFoundError:
+            print(f"Error: Could not find file '{args.json_file_path}'")
+            sys.exit(1)
+        except Exception as e:
+            print(f"Error parsing file: {e}")
+            sys.exit(1)
+    
     # Parse the JSON file
     try:
         parser = build_nested_object(args.json_file_path)